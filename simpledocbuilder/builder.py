@@ -5,20 +5,31 @@ Fournit une classe principale `SimpleDocBuilder` pour générer des documents Wo
 de manière modulaire et robuste.
 """
 
+import hashlib
 import logging
+import mmap
+import shutil
 import tempfile
 import sys
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
 from typing import List, Optional, Union, Any, Dict, Iterator
 
+import numpy as np
 import pandas as pd
 from docx import Document
 from docx.document import Document as _Document
+from docx.oxml.ns import qn
 from docx.shared import Mm
+from lxml import etree
 from docxcompose.composer import Composer
 from docxtpl import DocxTemplate, InlineImage
+from jinja2 import Environment
 from PIL import Image as PILImage
 
 # --- Gestion des dépendances optionnelles ---
@@ -36,10 +47,10 @@ except ImportError:
 
 # Import des utilitaires locaux
 try:
-    from simpledocbuilder.utils import eng_string, auto_crop_simple, random_name
+    from simpledocbuilder.utils import eng_format_array, auto_crop_image
 except ImportError:
     # Cas où simpledocbuilder est dans le path courant
-    from utils import eng_string, auto_crop_simple, random_name
+    from utils import eng_format_array, auto_crop_image
 
 # Configuration Logging
 logger = logging.getLogger("simpledocbuilder")
@@ -67,6 +78,63 @@ class DocumentConfig:
     default_table_header: str = ''
     default_index_name: str = ''
     logging_level: int = logging.INFO
+    # Rendu des blocs dans un pool de processus (l'assemblage reste séquentiel)
+    parallel_render: bool = False
+    max_workers: Optional[int] = None
+
+
+# --- Cache de templates ---
+
+# On ne met pas en cache les objets DocxTemplate eux-mêmes : render() mute
+# l'arbre XML sous-jacent, seul le contenu brut du fichier est réutilisable.
+@lru_cache(maxsize=32)
+def _template_bytes(path_str: str, mtime_ns: int) -> bytes:
+    return Path(path_str).read_bytes()
+
+
+class _CachingJinjaEnv(Environment):
+    """
+    Environnement Jinja partagé qui mémorise les templates compilés par
+    empreinte de leur source. docxtpl recompile le XML patché du template à
+    chaque render() ; pour un même template rendu N fois, la compilation
+    n'est ainsi payée qu'une fois. Cache LRU borné : une entrée par source
+    distincte, les moins utilisées sont évincées.
+    """
+
+    _max_compiled = 32
+
+    def __init__(self):
+        super().__init__()
+        self._compiled: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def from_string(self, source, globals=None, template_class=None):
+        if globals is not None or template_class is not None or not isinstance(source, str):
+            return super().from_string(source, globals, template_class)
+        key = hashlib.sha1(source.encode('utf-8')).digest()
+        template = self._compiled.get(key)
+        if template is None:
+            template = super().from_string(source)
+            self._compiled[key] = template
+            if len(self._compiled) > self._max_compiled:
+                self._compiled.popitem(last=False)
+        else:
+            self._compiled.move_to_end(key)
+        return template
+
+
+_JINJA_ENV = _CachingJinjaEnv()
+
+
+def _load_template(template_path: Union[str, Path]) -> DocxTemplate:
+    """Construit un DocxTemplate depuis un cache mémoire des octets du fichier.
+
+    Évite une lecture disque par rendu quand le même template est utilisé
+    par plusieurs blocs. Le cache (LRU borné) est invalidé si le fichier
+    change (mtime).
+    """
+    path = Path(template_path).resolve()
+    data = _template_bytes(str(path), path.stat().st_mtime_ns)
+    return DocxTemplate(BytesIO(data))
 
 
 # --- Abstraction Block ---
@@ -74,21 +142,105 @@ class DocumentConfig:
 class ContentBlock(ABC):
     """
     Classe abstraite représentant un bloc de contenu (Texte, Image, Tableau, etc.).
-    Chaque bloc est responsable de se rendre lui-même dans un fichier .docx temporaire.
+    Chaque bloc est responsable de produire un `Document` en mémoire ; la
+    sérialisation sur disque est optionnelle (voir `render`).
     """
     @abstractmethod
+    def render_doc(self, context: Dict[str, Any] = None) -> _Document:
+        """
+        Génère le contenu du bloc sous forme de `Document` en mémoire.
+
+        Args:
+            context: Contexte global optionnel (variables partagées).
+
+        Returns:
+            Le `Document` python-docx prêt à être assemblé ou sauvegardé.
+        """
+        pass
+
     def render(self, output_path: Path, context: Dict[str, Any] = None) -> Path:
         """
         Génère le contenu du bloc dans le fichier spécifié par output_path.
-        
+
         Args:
             output_path: Chemin absolu vers le fichier .docx de sortie.
             context: Contexte global optionnel (variables partagées).
-            
+
         Returns:
             Le chemin vers le fichier généré (output_path).
         """
-        pass
+        doc = self.render_doc(context)
+        doc.save(output_path)
+        return output_path
+
+    @classmethod
+    def render_batch(cls, blocks: List['ContentBlock'],
+                     context: Dict[str, Any] = None) -> List[Optional[_Document]]:
+        """
+        Rend un lot de blocs du même type concret.
+
+        Les sous-classes peuvent spécialiser ce point d'entrée pour factoriser
+        le travail commun à un lot homogène. Un bloc en échec donne None dans
+        la liste résultat (l'erreur est journalisée), les autres continuent.
+        """
+        docs: List[Optional[_Document]] = []
+        for block in blocks:
+            try:
+                docs.append(block.render_doc(context))
+            except Exception as e:
+                logger.error(f"Echec critique sur un bloc {cls.__name__}: {e}")
+                docs.append(None)
+        return docs
+
+
+# Prototype de document vierge, sérialisé une fois (rempli au premier usage)
+_PROTO_DOC_BYTES: Optional[bytes] = None
+
+
+def _blank_document() -> _Document:
+    """Retourne un Document vierge depuis un prototype gardé en mémoire.
+
+    Document() relit et re-parse le template par défaut de python-docx sur
+    disque à chaque appel ; ici le zip du document vierge n'est lu qu'une
+    fois, les appels suivants ne paient que le parse depuis la mémoire.
+    """
+    global _PROTO_DOC_BYTES
+    if _PROTO_DOC_BYTES is None:
+        buffer = BytesIO()
+        Document().save(buffer)
+        _PROTO_DOC_BYTES = buffer.getvalue()
+    return Document(BytesIO(_PROTO_DOC_BYTES))
+
+
+def _load_fragment(path: Union[str, Path]) -> _Document:
+    """Recharge en mémoire un fragment .docx produit par un outil externe.
+
+    Le fichier est projeté via mmap (pas de boucle de read(), une seule
+    copie vers la mémoire), avec repli sur une lecture à gros tampon si la
+    projection échoue (fichier vide, système de fichiers exotique).
+    """
+    try:
+        with open(path, 'rb') as fh:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return Document(BytesIO(mm))
+    except (ValueError, OSError):
+        buffer = BytesIO()
+        with open(path, 'rb', buffering=1 << 20) as fh:
+            shutil.copyfileobj(fh, buffer, length=1 << 20)
+        buffer.seek(0)
+        return Document(buffer)
+
+
+def _render_block_bytes(block: ContentBlock, context: Dict[str, Any]) -> bytes:
+    """Rend un bloc et retourne le .docx sérialisé (pour le rendu multi-processus).
+
+    Les objets `Document` (arbres lxml) ne traversent pas la frontière de
+    processus : chaque worker sérialise son fragment en octets, le parent
+    le rouvre depuis la mémoire avant assemblage.
+    """
+    buffer = BytesIO()
+    block.render_doc(context).save(buffer)
+    return buffer.getvalue()
 
 
 # --- Implémentations des Blocs ---
@@ -98,55 +250,91 @@ class TextBlock(ContentBlock):
     text: str
     style: Optional[str] = None  # ex: 'Heading 1', 'Normal'
 
-    def render(self, output_path: Path, context: Dict = None) -> Path:
-        doc = Document()
-        if self.text:
-            p = doc.add_paragraph(str(self.text))
-            if self.style:
+    @staticmethod
+    def _fill(doc: _Document, text: str, style: Optional[str]) -> _Document:
+        if text:
+            p = doc.add_paragraph(str(text))
+            if style:
                 try:
-                    p.style = self.style
+                    p.style = style
                 except KeyError:
-                    logger.warning(f"Style '{self.style}' introuvable, utilisation du style par défaut.")
-        doc.save(output_path)
-        return output_path
+                    logger.warning(f"Style '{style}' introuvable, utilisation du style par défaut.")
+        return doc
+
+    def render_doc(self, context: Dict = None) -> _Document:
+        return self._fill(_blank_document(), self.text, self.style)
+
+    @classmethod
+    def render_batch(cls, blocks: List['TextBlock'],
+                     context: Dict = None) -> List[Optional[_Document]]:
+        # Une sous-classe qui redéfinit render_doc doit passer par la voie
+        # générique, sinon sa redéfinition serait contournée
+        if cls is not TextBlock:
+            return super().render_batch(blocks, context)
+        # Spécialisation : extraction des attributs en amont, boucle serrée
+        # sans accès dataclass par itération
+        texts = [b.text for b in blocks]
+        styles = [b.style for b in blocks]
+        docs: List[Optional[_Document]] = []
+        for text, style in zip(texts, styles):
+            try:
+                docs.append(cls._fill(_blank_document(), text, style))
+            except Exception as e:
+                logger.error(f"Echec critique sur un bloc {cls.__name__}: {e}")
+                docs.append(None)
+        return docs
 
 
 @dataclass
 class ImageBlock(ContentBlock):
-    path: Union[str, Path]
+    # Chemin disque, ou image déjà en mémoire (PIL.Image, octets PNG, flux)
+    path: Union[str, Path, bytes, BytesIO, PILImage.Image]
     width_mm: int = 150
     caption: Optional[str] = None
     template_path: Optional[Union[str, Path]] = None
 
-    def render(self, output_path: Path, context: Dict = None) -> Path:
-        image_path = Path(self.path).resolve()
-        
-        if not image_path.exists():
-            # Gestion d'erreur locale : on crée un placeholder pour ne pas planter tout le build
-            logger.error(f"Image introuvable : {image_path}")
-            doc = Document()
-            doc.add_paragraph(f"[ERREUR: Image introuvable - {image_path.name}]", style="Normal")
-            doc.save(output_path)
-            return output_path
+    def render_doc(self, context: Dict = None) -> _Document:
+        # Sources mémoire : une image PIL est encodée une fois en PNG,
+        # des octets sont enveloppés tels quels — aucun accès disque
+        source = self.path
+        if isinstance(source, PILImage.Image):
+            buffer = BytesIO()
+            source.save(buffer, format='PNG')
+            buffer.seek(0)
+            source = buffer
+        elif isinstance(source, (bytes, bytearray)):
+            source = BytesIO(bytes(source))
+
+        if isinstance(source, BytesIO):
+            image_ref: Any = source
+        else:
+            image_path = Path(source).resolve()
+            if not image_path.exists():
+                # Gestion d'erreur locale : on crée un placeholder pour ne pas planter tout le build
+                logger.error(f"Image introuvable : {image_path}")
+                doc = Document()
+                doc.add_paragraph(f"[ERREUR: Image introuvable - {image_path.name}]", style="Normal")
+                return doc
+            image_ref = str(image_path)
 
         if self.template_path:
             # Mode Template : injection dans un conteneur existant
             tpl_path = Path(self.template_path).resolve()
             if not tpl_path.exists():
                 raise DocumentError(f"Template d'image introuvable : {tpl_path}")
-            
-            doc = DocxTemplate(tpl_path)
+
+            doc = _load_template(tpl_path)
             # On assume que le template attend 'image' et 'title'
             render_context = {
-                'image': InlineImage(doc, str(image_path), width=Mm(self.width_mm)),
+                'image': InlineImage(doc, image_ref, width=Mm(self.width_mm)),
                 'title': self.caption or ""
             }
             # Merge avec le contexte global si nécessaire
             if context:
                 render_context = {**context, **render_context}
-                
-            doc.render(render_context)
-            doc.save(output_path)
+
+            doc.render(render_context, _JINJA_ENV)
+            return doc.docx
         else:
             # Mode Simple : ajout direct
             doc = Document()
@@ -157,13 +345,11 @@ class ImageBlock(ContentBlock):
                 except:
                     doc.add_paragraph(self.caption)
             try:
-                doc.add_picture(str(image_path), width=Mm(self.width_mm))
+                doc.add_picture(image_ref, width=Mm(self.width_mm))
             except Exception as e:
-                logger.error(f"Erreur lors de l'ajout de l'image {image_path}: {e}")
+                logger.error(f"Erreur lors de l'ajout de l'image {image_ref}: {e}")
                 doc.add_paragraph(f"[ERREUR IMAGE: {e}]")
-            doc.save(output_path)
-            
-        return output_path
+            return doc
 
 
 @dataclass
@@ -176,33 +362,93 @@ class DataFrameBlock(ContentBlock):
     use_eng_format: bool = True
     template_path: Optional[Union[str, Path]] = None
 
-    def render(self, output_path: Path, context: Dict = None) -> Path:
+    @staticmethod
+    def _append_table_xml(doc: _Document, header: List[str],
+                          idx_arr: np.ndarray, body_arr: np.ndarray) -> None:
+        """
+        Construit le <w:tbl> directement en lxml et l'insère dans le corps.
+
+        Évite la couche objet python-docx (add_table crée un _Cell Python par
+        cellule) : seuls des éléments XML sont créés, en une passe sur les
+        tableaux de chaînes pré-rendus.
+        """
+        tbl = etree.Element(qn('w:tbl'))
+        tbl_pr = etree.SubElement(tbl, qn('w:tblPr'))
+        tbl_style = etree.SubElement(tbl_pr, qn('w:tblStyle'))
+        tbl_style.set(qn('w:val'), doc.styles['Table Grid'].style_id)
+        tbl_w = etree.SubElement(tbl_pr, qn('w:tblW'))
+        tbl_w.set(qn('w:w'), '0')
+        tbl_w.set(qn('w:type'), 'auto')
+
+        grid = etree.SubElement(tbl, qn('w:tblGrid'))
+        for _ in range(len(header)):
+            etree.SubElement(grid, qn('w:gridCol'))
+
+        tag_tr, tag_tc = qn('w:tr'), qn('w:tc')
+        tag_p, tag_r, tag_t = qn('w:p'), qn('w:r'), qn('w:t')
+        space_attr = qn('xml:space')
+
+        def append_row(texts):
+            tr = etree.SubElement(tbl, tag_tr)
+            for text in texts:
+                tc = etree.SubElement(tr, tag_tc)
+                p = etree.SubElement(tc, tag_p)
+                r = etree.SubElement(p, tag_r)
+                t = etree.SubElement(r, tag_t)
+                t.text = text
+                t.set(space_attr, 'preserve')
+
+        append_row(header)
+        for i in range(len(idx_arr)):
+            append_row([idx_arr[i]] + list(body_arr[i]))
+
+        # Insertion avant le sectPr final, comme le ferait add_table
+        body = doc.element.body
+        sect_pr = body.find(qn('w:sectPr'))
+        if sect_pr is not None:
+            sect_pr.addprevious(tbl)
+        else:
+            body.append(tbl)
+
+    def render_doc(self, context: Dict = None) -> _Document:
         if self.df.empty:
             logger.warning("DataFrame vide, génération d'un bloc vide.")
             doc = Document()
             doc.add_paragraph("[Tableau Vide]")
-            doc.save(output_path)
-            return output_path
-
-        local_df = self.df.copy()
+            return doc
 
         # Formatage des données numériques
         if self.use_eng_format:
-            # Compatibilité Pandas map vs applymap
-            method = getattr(local_df, "map", getattr(local_df, "applymap"))
-            # Applique eng_string uniquement sur les numériques (int/float)
-            local_df = method(lambda x: eng_string(x, formating=self.formatting) if isinstance(x, (int, float)) else x)
+            # Copie superficielle seulement : le formatage remplace des
+            # références de colonnes entières, les données du DataFrame
+            # appelant ne sont jamais modifiées en place
+            local_df = self.df.copy(deep=False)
+            # Dispatch au niveau dtype : un test par colonne au lieu d'un
+            # isinstance par cellule ; les colonnes non numériques sont
+            # laissées telles quelles. Itération positionnelle : un accès
+            # par label renverrait un DataFrame en cas de labels dupliqués
+            for i in range(local_df.shape[1]):
+                col = local_df.iloc[:, i]
+                if pd.api.types.is_numeric_dtype(col):
+                    local_df.isetitem(i, eng_format_array(col.to_numpy(), formating=self.formatting))
+        else:
+            # Lecture seule en aval (astype/where/to_dict créent de nouveaux
+            # objets) : pas besoin d'isoler le DataFrame appelant
+            local_df = self.df
 
         if self.template_path:
             # Mode Template
-            doc = DocxTemplate(self.template_path)
+            doc = _load_template(self.template_path)
             # Préparation structure de données typique pour iterer dans jinja2
             # Structure proposée: table.col_labels, table.tbl_contents -> [{label: index, cols: [vals]}]
+            # to_dict('split') extrait index/colonnes/données en un appel C,
+            # sans créer une Series par ligne comme iterrows
+            split = local_df.to_dict('split')
             table_data = {
-                'col_labels': local_df.columns.tolist(),
+                'col_labels': split['columns'],
                 'tbl_contents': [
-                    {'label': idx, 'cols': row.tolist()} 
-                    for idx, row in local_df.iterrows()
+                    {'label': idx, 'cols': row}
+                    for idx, row in zip(split['index'], split['data'])
                 ]
             }
             render_context = {
@@ -213,39 +459,29 @@ class DataFrameBlock(ContentBlock):
             }
             if context:
                 render_context = {**context, **render_context}
-            
-            doc.render(render_context)
-            doc.save(output_path)
-            
+
+            doc.render(render_context, _JINJA_ENV)
+            return doc.docx
+
         else:
             # Mode Natif (Word Table)
             doc = Document()
             if self.title:
                 doc.add_heading(self.title, level=2)
-            
-            # +1 pour l'index
-            rows_count = len(local_df) + 1
-            cols_count = len(local_df.columns) + 1
-            
-            table = doc.add_table(rows=rows_count, cols=cols_count)
-            table.style = 'Table Grid'
-            
-            # Header
-            hdr_cells = table.rows[0].cells
-            hdr_cells[0].text = str(self.index_name)
-            for i, col in enumerate(local_df.columns):
-                hdr_cells[i+1].text = str(col)
-            
-            # Body
-            for i, (idx, row) in enumerate(local_df.iterrows()):
-                row_cells = table.rows[i+1].cells
-                row_cells[0].text = str(idx)
-                for j, val in enumerate(row):
-                    row_cells[j+1].text = str(val) if pd.notna(val) else ""
-            
-            doc.save(output_path)
 
-        return output_path
+            # Header (index + colonnes)
+            header = [str(self.index_name)] + [str(col) for col in local_df.columns]
+
+            # Body : conversion en chaînes vectorisée côté pandas (les NaN
+            # deviennent "" avant le passage en str, sans test Python par cellule)
+            idx_arr = local_df.index.astype(str).to_numpy()
+            str_df = local_df.astype(object).where(local_df.notna(), "").astype(str)
+            body_arr = str_df.to_numpy(copy=False)
+
+            # Injection XML directe, sans passer par add_table/_Cell
+            self._append_table_xml(doc, header, idx_arr, body_arr)
+
+            return doc
 
 
 @dataclass
@@ -254,64 +490,66 @@ class TemplateBlock(ContentBlock):
     template_path: Union[str, Path]
     data_context: Dict[str, Any]
 
-    def render(self, output_path: Path, context: Dict = None) -> Path:
-        doc = DocxTemplate(self.template_path)
+    def render_doc(self, context: Dict = None) -> _Document:
+        doc = _load_template(self.template_path)
         # Fusion contexte global + contexte local
         full_context = {**(context or {}), **self.data_context}
-        doc.render(full_context)
-        doc.save(output_path)
-        return output_path
+        doc.render(full_context, _JINJA_ENV)
+        return doc.docx
 
 
 @dataclass
 class LatexBlock(ContentBlock):
     latex_content: str
     
-    def render(self, output_path: Path, context: Dict = None) -> Path:
+    def render_doc(self, context: Dict = None) -> _Document:
         if not PYPANDOC_AVAILABLE:
             raise DocumentError("pypandoc requis mais non installé.")
-        
+
         if not self.latex_content.strip():
             # Pas de contenu, on crée un doc vide
-            doc = Document()
-            doc.save(output_path)
-            return output_path
+            return Document()
 
-        try:
-            pypandoc.convert_text(
-                self.latex_content,
-                format='latex',
-                to='docx',
-                outputfile=str(output_path)
-            )
-        except Exception as e:
-            raise DocumentError(f"Erreur conversion LaTeX: {e}")
-        return output_path
+        # pandoc ne sait écrire du docx que dans un fichier : on passe par un
+        # fichier temporaire relu une seule fois en mémoire.
+        with tempfile.TemporaryDirectory(prefix='sdb_pandoc_') as tmp_dir:
+            frag_path = Path(tmp_dir) / "fragment.docx"
+            try:
+                pypandoc.convert_text(
+                    self.latex_content,
+                    format='latex',
+                    to='docx',
+                    outputfile=str(frag_path)
+                )
+            except Exception as e:
+                raise DocumentError(f"Erreur conversion LaTeX: {e}")
+            return _load_fragment(frag_path)
 
 
 @dataclass
 class HtmlBlock(ContentBlock):
     html_content: str
     
-    def render(self, output_path: Path, context: Dict = None) -> Path:
+    def render_doc(self, context: Dict = None) -> _Document:
         if not PYPANDOC_AVAILABLE:
             raise DocumentError("pypandoc requis mais non installé.")
-        
+
         if not self.html_content.strip():
-            doc = Document()
-            doc.save(output_path)
-            return output_path
-            
-        try:
-            pypandoc.convert_text(
-                self.html_content,
-                format='html',
-                to='docx',
-                outputfile=str(output_path)
-            )
-        except Exception as e:
-            raise DocumentError(f"Erreur conversion HTML: {e}")
-        return output_path
+            return Document()
+
+        # Même stratégie que LatexBlock : fichier temporaire relu une seule fois.
+        with tempfile.TemporaryDirectory(prefix='sdb_pandoc_') as tmp_dir:
+            frag_path = Path(tmp_dir) / "fragment.docx"
+            try:
+                pypandoc.convert_text(
+                    self.html_content,
+                    format='html',
+                    to='docx',
+                    outputfile=str(frag_path)
+                )
+            except Exception as e:
+                raise DocumentError(f"Erreur conversion HTML: {e}")
+            return _load_fragment(frag_path)
 
 
 @dataclass
@@ -321,41 +559,40 @@ class GreatTableBlock(ContentBlock):
     width_mm: int = 150
     title: Optional[str] = None
     template_path: Optional[Union[str, Path]] = None
-    temp_dir_gen: Any = None # Nécessaire pour générer l'image temp dans le même dossier
 
-    def render(self, output_path: Path, context: Dict = None) -> Path:
+    def render_doc(self, context: Dict = None) -> _Document:
         if not IMGKIT_AVAILABLE:
             raise DocumentError("imgkit requis pour GreatTableBlock.")
-        
-        # 1. Générer l'image depuis le HTML
-        # On a besoin d'un chemin temporaire pour l'image
-        # On utilise le même dossier que output_path pour être propre
-        img_filename = output_path.with_suffix('.png')
-        
+
+        # 1. Générer l'image depuis le HTML, récupérée directement en octets
+        # (chemin False : wkhtmltoimage écrit sur stdout, pas de PNG temporaire)
         try:
-            imgkit.from_string(self.html_str, str(img_filename), options={'quiet': ''})
+            png_bytes = imgkit.from_string(
+                self.html_str, False, options={'quiet': '', 'format': 'png'}
+            )
         except Exception as e:
             logger.error(f"Echec imgkit: {e}")
             # Tente de continuer ou fallback
             doc = Document()
             doc.add_paragraph(f"[ERREUR IMGKIT: {e}]")
-            doc.save(output_path)
-            return output_path
+            return doc
+
+        # 2. Rogner l'image (auto-crop), entièrement en mémoire
+        img = PILImage.open(BytesIO(png_bytes))
+        cropped = auto_crop_image(img)
+        if cropped is not None:
+            img = cropped
 
-        # 2. Rogner l'image (auto-crop)
-        cropped = auto_crop_simple(img_filename)
-        if cropped:
-            cropped.save(img_filename)
-        
         # 3. Insérer l'image (réutilisation de logic ImageBlock simplifiée)
-        # On délègue à ImageBlock pour ne pas dupliquer la logique template/simple
+        # On délègue à ImageBlock, qui accepte l'image PIL directement :
+        # un seul décodage PNG et un seul encodage sur toute la chaîne
         img_block = ImageBlock(
-            path=img_filename, 
-            width_mm=self.width_mm, 
-            caption=self.title, 
+            path=img,
+            width_mm=self.width_mm,
+            caption=self.title,
             template_path=self.template_path
         )
-        return img_block.render(output_path, context)
+        return img_block.render_doc(context)
 
 
 # --- Le Builder Principal ---
@@ -369,29 +606,23 @@ class SimpleDocBuilder:
     def __init__(self, config: Optional[DocumentConfig] = None):
         self.config = config or DocumentConfig()
         self.blocks: List[ContentBlock] = []
-        self._temp_dir: Optional[tempfile.TemporaryDirectory] = None
-        self._name_gen = random_name()
         self.global_context: Dict[str, Any] = {}
-        
+
         # Validation du logging
         logger.setLevel(self.config.logging_level)
 
     def init(self):
-        """Initialisation explicite du dossier temporaire."""
-        if self._temp_dir is None:
-            self._temp_dir = tempfile.TemporaryDirectory(prefix=self.config.temp_prefix)
-            logger.info(f"Dossier temporaire initialisé: {self._temp_dir.name}")
+        """Initialisation explicite (conservée pour compatibilité d'API).
+
+        Depuis le rendu en mémoire, le builder n'a plus de dossier temporaire
+        à gérer : les blocs dépendant d'outils externes (pandoc, imgkit)
+        créent et nettoient leur propre espace temporaire.
+        """
         return self
 
     def cleanup(self):
-        """Nettoyage des ressources."""
-        if self._temp_dir:
-            try:
-                self._temp_dir.cleanup()
-                logger.info("Dossier temporaire nettoyé.")
-            except Exception as e:
-                logger.warning(f"Erreur lors du nettoyage du dossier temporaire: {e}")
-            self._temp_dir = None
+        """Nettoyage des ressources (plus rien à nettoyer, voir `init`)."""
+        pass
 
     def __enter__(self):
         self.init()
@@ -400,12 +631,6 @@ class SimpleDocBuilder:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.cleanup()
 
-    def _get_next_path(self) -> Path:
-        """Retourne un chemin unique pour le prochain fragment."""
-        if not self._temp_dir:
-            self.init() # Auto-init si oublié
-        return Path(self._temp_dir.name) / f"{next(self._name_gen)}.docx"
-
     # --- API Fluent ---
 
     def add(self, block: ContentBlock) -> 'SimpleDocBuilder':
@@ -478,37 +703,55 @@ class SimpleDocBuilder:
         
         master_doc = Document()
         composer = Composer(master_doc)
-        
-        # Indicateur pour savoir si c'est le premier document ajouté
-        # (docxcompose conseille d'append sur un master, mais si master vide, 
-        # le premier doc définit parfois les styles de base mieux que le vide)
-        is_first = True
 
-        for i, block in enumerate(self.blocks):
-            try:
-                # 1. Rendu individuel
-                fragment_path = self._get_next_path()
-                block.render(fragment_path, context=self.global_context)
-                
-                # 2. Composition
-                # On utilise append pour tout le monde. Composer gère les sauts de section.
-                # Pour plus de robustesse, on re-ouvre le docx généré pour le valider
-                if fragment_path.exists():
+        if self.config.parallel_render and len(self.blocks) > 1:
+            # Rendu des blocs en parallèle ; l'assemblage (docxcompose) reste
+            # séquentiel dans le processus parent, dans l'ordre des blocs.
+            with ProcessPoolExecutor(max_workers=self.config.max_workers) as pool:
+                futures = [
+                    pool.submit(_render_block_bytes, block, self.global_context)
+                    for block in self.blocks
+                ]
+                for i, future in enumerate(futures):
+                    try:
+                        part_doc = Document(BytesIO(future.result()))
+                    except Exception as e:
+                        logger.error(f"Echec critique sur le bloc {i}: {e}")
+                        continue
                     try:
-                        part_doc = Document(str(fragment_path))
                         composer.append(part_doc)
-                        logger.debug(f"Bloc {i+1}/{len(self.blocks)} ajouté ({type(block).__name__}).")
+                        logger.debug(f"Bloc {i+1}/{len(self.blocks)} ajouté ({type(self.blocks[i]).__name__}).")
                     except Exception as e:
                         logger.error(f"Erreur lors de l'assemblage du bloc {i+1}: {e}")
-                else:
-                    logger.error(f"Erreur: Le fichier fragment {fragment_path} n'a pas été généré.")
-
-            except Exception as e:
-                logger.error(f"Echec critique sur le bloc {i}: {e}")
-                # On continue pour essayer de sauver ce qui peut l'être ?
-                # Ou on raise ? Spec dit "build fusionne". Si un bloc fail, le doc est incomplet.
-                # On choisit de continuer en logguant l'erreur pour la robustesse (partial result > no result)
-                continue
+        else:
+            # 1. Rendu groupé par type concret : chaque lot homogène passe par
+            # render_batch (boucle spécialisable par classe), puis on réassemble
+            # les fragments dans l'ordre d'origine pour la composition.
+            groups: Dict[type, List[int]] = {}
+            for i, block in enumerate(self.blocks):
+                groups.setdefault(type(block), []).append(i)
+
+            rendered: List[Optional[_Document]] = [None] * len(self.blocks)
+            for block_cls, indices in groups.items():
+                docs = block_cls.render_batch(
+                    [self.blocks[i] for i in indices], context=self.global_context
+                )
+                for i, part_doc in zip(indices, docs):
+                    rendered[i] = part_doc
+
+            # 2. Composition séquentielle dans l'ordre des blocs.
+            # On utilise append pour tout le monde. Composer gère les sauts de section.
+            # Un bloc en échec (None) est ignoré : on sauve ce qui peut l'être
+            # (partial result > no result)
+            for i, part_doc in enumerate(rendered):
+                if part_doc is None:
+                    logger.error(f"Echec critique sur le bloc {i}: fragment non généré.")
+                    continue
+                try:
+                    composer.append(part_doc)
+                    logger.debug(f"Bloc {i+1}/{len(self.blocks)} ajouté ({type(self.blocks[i]).__name__}).")
+                except Exception as e:
+                    logger.error(f"Erreur lors de l'assemblage du bloc {i+1}: {e}")
 
         try:
             composer.save(str(final_path))
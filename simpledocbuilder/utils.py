@@ -5,10 +5,25 @@ from typing import Any, Union, Iterator
 from PIL import Image
 import numpy as np
 
+# --- Dépendance optionnelle : numba pour les petits noyaux numériques ---
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 def random_name(num_max : int = 6) -> Iterator[str]:
+    # Tirage par lots : un seul appel random.choices (boucle C) pour 1024 noms
+    # au lieu d'un random.choice Python par caractère
+    batch_size = num_max * 1024
+    buf = random.choices(string.ascii_lowercase, k=batch_size)
+    i = 0
     while True:
-        name = ''.join([random.choice(string.ascii_lowercase) for j in range(num_max)])
-        yield name
+        yield ''.join(buf[i:i + num_max])
+        i += num_max
+        if i >= batch_size:
+            buf = random.choices(string.ascii_lowercase, k=batch_size)
+            i = 0
 
 def percent_string(x : str, formating : str ='{:2.2%}') -> str:
     """
@@ -23,6 +38,23 @@ def percent_string(x : str, formating : str ='{:2.2%}') -> str:
     """    
     return formating.format(x)
 
+def _eng_core(x : float):
+    """
+    Noyau numérique de `eng_string` : signe, mantisse et exposant multiple de 3.
+    Compilé via numba si disponible (le formatage printf reste côté Python).
+    """
+    sign = x < 0.0
+    if sign:
+        x = -x
+    exp = int(math.floor(math.log10(x)))
+    exp3 = exp - (exp % 3)
+    return sign, x / 10.0 ** exp3, exp3
+
+if NUMBA_AVAILABLE:
+    # cache=True : le coût de compilation n'est payé qu'une fois par machine
+    _eng_core = numba.njit(cache=True)(_eng_core)
+
+
 def eng_string( x, formating='%.2f', si=False):
     '''
     https://stackoverflow.com/questions/17973278/python-decimal-engineering-notation-for-mili-10e-3-and-micro-10e-6/46053685
@@ -47,14 +79,8 @@ def eng_string( x, formating='%.2f', si=False):
     if abs(x) <= 1e-3:
         return '0'
 
-    sign = ''
-    if x < 0:
-        x = -x
-        sign = '-'
-    
-    exp = int( math.floor( math.log10( x)))
-    exp3 = exp - ( exp % 3)
-    x3 = x / ( 10 ** exp3)
+    negative, x3, exp3 = _eng_core(float(x))
+    sign = '-' if negative else ''
 
     if si and exp3 >= -24 and exp3 <= 24 and exp3 != 0:
         exp3_text = 'yzafpnum kMGTPEZY'[ int(( exp3 - (-24)) / 3)]
@@ -65,40 +91,133 @@ def eng_string( x, formating='%.2f', si=False):
     return ( '%s'+formating+'%s') % ( sign, x3, exp3_text)
 
 
-def auto_crop_simple(image_path, tolerance=20):
+def eng_format_array(arr : np.ndarray, formating : str = '%.2f') -> np.ndarray:
     """
-    Tente de rogner une image en cherchant le premier pixel non-blanc depuis les bords.
-    Moins robuste que la méthode OpenCV.
+    eng_format_array Version vectorisée de `eng_string` pour un tableau numérique.
+
+    Produit les mêmes chaînes que `eng_string` (notation ingénieur, exposant
+    multiple de 3) mais calcule exposants et mantisses en une passe NumPy au
+    lieu d'un appel Python par valeur. Les NaN sont propagés tels quels
+    (à masquer en aval), les valeurs |x| <= 1e-3 donnent '0'.
 
     Args:
-        image_path (str): Chemin vers l'image.
+        arr (np.ndarray): Tableau de valeurs numériques.
+        formating (str, optional): Format printf appliqué à la mantisse. Defaults to '%.2f'.
+
+    Returns:
+        np.ndarray: Tableau object de chaînes formatées (NaN préservés).
+    """
+    values = np.asarray(arr, dtype=np.float64)
+    out = np.full(values.shape, '0', dtype=object)
+
+    nan_mask = np.isnan(values)
+    out[nan_mask] = np.nan
+
+    fmt_mask = (np.abs(values) > 1e-3) & ~nan_mask
+    if not fmt_mask.any():
+        return out
+
+    vals = values[fmt_mask]
+    exp3 = (np.floor(np.log10(np.abs(vals))).astype(np.int64) // 3) * 3
+    mantissa = vals / 10.0 ** exp3
+
+    texts = np.char.mod(formating, mantissa)
+    suffix = np.where(exp3 == 0, '', np.char.add('e', exp3.astype(str)))
+    out[fmt_mask] = np.char.add(texts, suffix)
+    return out
+
+
+def _bbox_gray(gray : np.ndarray, threshold : int):
+    """
+    Boîte englobante du contenu non-blanc d'une image en niveaux de gris.
+
+    Retourne (min_row, max_row, min_col, max_col), ou (-1, -1, -1, -1) si
+    l'image est entièrement blanche.
+    """
+    # Une seule passe sur le masque : nonzero parcourt en ordre ligne-major,
+    # donc rows[0]/rows[-1] donnent directement les bornes verticales
+    rows, cols = (gray <= threshold).nonzero()
+    if rows.size == 0:
+        return -1, -1, -1, -1
+    return rows[0], rows[-1], cols.min(), cols.max()
+
+if NUMBA_AVAILABLE:
+    # Variante compilée : scans avec sortie anticipée depuis chaque bord,
+    # sans matérialiser le masque booléen complet
+    @numba.njit(cache=True)
+    def _bbox_gray(gray, threshold):
+        h, w = gray.shape
+        min_row = -1
+        for i in range(h):
+            for j in range(w):
+                if gray[i, j] <= threshold:
+                    min_row = i
+                    break
+            if min_row >= 0:
+                break
+        if min_row < 0:
+            return -1, -1, -1, -1
+
+        max_row = min_row
+        for i in range(h - 1, min_row - 1, -1):
+            found = False
+            for j in range(w):
+                if gray[i, j] <= threshold:
+                    found = True
+                    break
+            if found:
+                max_row = i
+                break
+
+        min_col = w - 1
+        for j in range(w):
+            found = False
+            for i in range(min_row, max_row + 1):
+                if gray[i, j] <= threshold:
+                    found = True
+                    break
+            if found:
+                min_col = j
+                break
+
+        max_col = min_col
+        for j in range(w - 1, min_col - 1, -1):
+            found = False
+            for i in range(min_row, max_row + 1):
+                if gray[i, j] <= threshold:
+                    found = True
+                    break
+            if found:
+                max_col = j
+                break
+
+        return min_row, max_row, min_col, max_col
+
+
+def auto_crop_image(img, tolerance=20):
+    """
+    Variante en mémoire de `auto_crop_simple` : opère sur une image PIL déjà
+    ouverte, sans lecture disque.
+
+    Args:
+        img (PIL.Image.Image): Image à rogner.
         tolerance (int): Tolérance pour le blanc (plus la valeur est haute, plus on tolère un gris clair comme du blanc).
 
     Returns:
         PIL.Image.Image: L'image rognée, ou None.
     """
     try:
-        img = Image.open(image_path).convert("RGB")
-        data = np.array(img)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
 
-        # Cherche les lignes/colonnes qui ne sont PAS "blanches" (avec tolérance)
-        # On définit le blanc comme (R > 255 - tolerance, G > 255 - tolerance, B > 255 - tolerance)
-        is_white = (data[:, :, 0] > 255 - tolerance) & \
-                   (data[:, :, 1] > 255 - tolerance) & \
-                   (data[:, :, 2] > 255 - tolerance)
+        # Détection sur la luminance : un seul canal à comparer au lieu de
+        # trois, et un tableau trois fois plus petit à parcourir
+        gray = np.asarray(img.convert("L"))
 
-        # Trouver les coordonnées du contenu
-        rows = np.any(~is_white, axis=1) # Lignes ayant au moins un pixel non-blanc
-        cols = np.any(~is_white, axis=0) # Colonnes ayant au moins un pixel non-blanc
-
-        min_row = np.argmax(rows)
-        max_row = len(rows) - np.argmax(rows[::-1]) - 1 # Recherche inversée pour le max
-
-        min_col = np.argmax(cols)
-        max_col = len(cols) - np.argmax(cols[::-1]) - 1 # Recherche inversée pour le max
+        min_row, max_row, min_col, max_col = _bbox_gray(gray, 255 - tolerance)
 
         # Gérer le cas où rien n'est trouvé (image entièrement blanche)
-        if not np.any(rows) or not np.any(cols):
+        if min_row < 0:
             print("Aucun contenu non-blanc trouvé.")
             return None
 
@@ -110,6 +229,26 @@ def auto_crop_simple(image_path, tolerance=20):
         print(f"Erreur lors du rognage simple: {e}")
         return None
 
+
+def auto_crop_simple(image_path, tolerance=20):
+    """
+    Tente de rogner une image en cherchant le premier pixel non-blanc depuis les bords.
+    Moins robuste que la méthode OpenCV.
+
+    Args:
+        image_path (str): Chemin vers l'image.
+        tolerance (int): Tolérance pour le blanc (plus la valeur est haute, plus on tolère un gris clair comme du blanc).
+
+    Returns:
+        PIL.Image.Image: L'image rognée, ou None.
+    """
+    try:
+        img = Image.open(image_path)
+    except Exception as e:
+        print(f"Erreur lors du rognage simple: {e}")
+        return None
+    return auto_crop_image(img, tolerance=tolerance)
+
 # Exemple d'utilisation (avec PIL)
 # from PIL import Image
 # input_image_path = 'votre_image_tableau.png'